@@ -83,100 +83,10 @@ class ExprType(Variant):
 
     def as_class(self) -> type:
         """Return the class associated with this ExprType."""
-        match self:
-            case ExprType.CALL_EXPR:
-                return CallExpr
-            case ExprType.VAR:
-                return Var
-            case ExprType.STR:
-                return LiteralString
-            case ExprType.REGEX:
-                return Regex
-            # booleans
-            case ExprType.BOOL:
-                return LiteralBool
-            case ExprType.CALL_EXPR_CONTEXT:
-                return CallExprContext
-            case ExprType.HAVOC:
-                return Havoc
-            case ExprType.CONJUNCTION:
-                return Conjunction
-            case ExprType.DISJUNCTION:
-                return Disjunction
-            case ExprType.NOT:
-                return Not
-            # Juniper policy chains
-            case ExprType.CONJUNCTION_CHAIN:
-                return ConjunctionChain
-            case ExprType.FIRST_MATCH_CHAIN:
-                return FirstMatchChain
-            # integers
-            case ExprType.INT:
-                return LiteralInt
-            case ExprType.UINT:
-                return LiteralUInt
-            case ExprType.BIG_INT:
-                return LiteralBigInt
-            case ExprType.ADD:
-                return Add
-            case ExprType.SUB:
-                return Sub
-            case ExprType.EQ:
-                return Equal
-            case ExprType.NEQ:
-                return NotEqual
-            case ExprType.LT:
-                return LessThan
-            case ExprType.LE:
-                return LessThanEqual
-            case ExprType.GT:
-                return GreaterThan
-            case ExprType.GE:
-                return GreaterThanEqual
-            # sets
-            case ExprType.LITERAL_SET:
-                return LiteralSet
-            case ExprType.SET_ADD:
-                return SetAdd
-            case ExprType.SET_DIFFERENCE:
-                return SetDifference
-            case ExprType.SET_REMOVE:
-                return SetRemove
-            case ExprType.SET_UNION:
-                return SetUnion
-            case ExprType.SET_CONTAINS:
-                return SetContains
-            case ExprType.SUBSET:
-                return Subset
-            # records
-            case ExprType.CREATE:
-                return CreateRecord
-            case ExprType.GET_FIELD:
-                return GetField
-            case ExprType.WITH_FIELD:
-                return WithField
-            # pair
-            case ExprType.PAIR:
-                return Pair
-            case ExprType.FIRST:
-                return First
-            case ExprType.SECOND:
-                return Second
-            # ip addresses
-            case ExprType.IP_ADDRESS:
-                return IpAddress
-            case ExprType.IP_PREFIX:
-                return IpPrefix
-            case ExprType.PREFIX_CONTAINS:
-                return PrefixContains
-            case ExprType.PREFIX_SET:
-                return PrefixSet
-            case ExprType.MATCH_PREFIX_SET:
-                return MatchPrefixSet
-            case ExprType.ROUTE_FILTER_LIST:
-                return RouteFilterListExpr
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 @dataclass
@@ -1056,3 +966,56 @@ class MatchPrefixSet(
         self.prefix = self.prefix.subst(environment)
         self.prefix_set = self.prefix_set.subst(environment)
         return self
+
+
+_EXPR_CLASSES: dict[ExprType, type] = {
+    ExprType.CALL_EXPR: CallExpr,
+    ExprType.VAR: Var,
+    ExprType.STR: LiteralString,
+    ExprType.REGEX: Regex,
+    # booleans
+    ExprType.BOOL: LiteralBool,
+    ExprType.CALL_EXPR_CONTEXT: CallExprContext,
+    ExprType.HAVOC: Havoc,
+    ExprType.CONJUNCTION: Conjunction,
+    ExprType.DISJUNCTION: Disjunction,
+    ExprType.NOT: Not,
+    # Juniper policy chains
+    ExprType.CONJUNCTION_CHAIN: ConjunctionChain,
+    ExprType.FIRST_MATCH_CHAIN: FirstMatchChain,
+    # integers
+    ExprType.INT: LiteralInt,
+    ExprType.UINT: LiteralUInt,
+    ExprType.BIG_INT: LiteralBigInt,
+    ExprType.ADD: Add,
+    ExprType.SUB: Sub,
+    ExprType.EQ: Equal,
+    ExprType.NEQ: NotEqual,
+    ExprType.LT: LessThan,
+    ExprType.LE: LessThanEqual,
+    ExprType.GT: GreaterThan,
+    ExprType.GE: GreaterThanEqual,
+    # sets
+    ExprType.LITERAL_SET: LiteralSet,
+    ExprType.SET_ADD: SetAdd,
+    ExprType.SET_DIFFERENCE: SetDifference,
+    ExprType.SET_REMOVE: SetRemove,
+    ExprType.SET_UNION: SetUnion,
+    ExprType.SET_CONTAINS: SetContains,
+    ExprType.SUBSET: Subset,
+    # records
+    ExprType.CREATE: CreateRecord,
+    ExprType.GET_FIELD: GetField,
+    ExprType.WITH_FIELD: WithField,
+    # pair
+    ExprType.PAIR: Pair,
+    ExprType.FIRST: First,
+    ExprType.SECOND: Second,
+    # ip addresses
+    ExprType.IP_ADDRESS: IpAddress,
+    ExprType.IP_PREFIX: IpPrefix,
+    ExprType.PREFIX_CONTAINS: PrefixContains,
+    ExprType.PREFIX_SET: PrefixSet,
+    ExprType.MATCH_PREFIX_SET: MatchPrefixSet,
+    ExprType.ROUTE_FILTER_LIST: RouteFilterListExpr,
+}
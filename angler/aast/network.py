@@ -42,7 +42,7 @@ class ExternalPeer(
     Serialize,
     ip=Field("Ip", IPv4Address),
     asnum=Field("ASNumber", int, None),
-    peering=Field("Peering", list[str], []),
+    peering=Field("Peering", tuple[str, ...], ()),
 ):
     """
     Representation of an external peer connection.
@@ -50,7 +50,7 @@ class ExternalPeer(
 
     ip: IPv4Address
     asnum: Optional[int] = None
-    peering: list[str] = field(default_factory=list)
+    peering: tuple[str, ...] = ()
 
 
 @dataclass
@@ -138,7 +138,7 @@ class Network(
             if n in nodes
         }
         new_externals = [
-            replace(e, peering=[p for p in e.peering if p in nodes])
+            replace(e, peering=tuple(p for p in e.peering if p in nodes))
             for e in self.externals
             # drop removed nodes
             if str(e.ip) in nodes
@@ -23,21 +23,10 @@ class StatementType(Variant):
     SET_DEFAULT_POLICY = "SetDefaultPolicy"
 
     def as_class(self) -> type:
-        match self:
-            case StatementType.SKIP:
-                return SkipStatement
-            case StatementType.SEQ:
-                return SeqStatement
-            case StatementType.IF:
-                return IfStatement
-            case StatementType.ASSIGN:
-                return AssignStatement
-            case StatementType.RETURN:
-                return ReturnStatement
-            case StatementType.SET_DEFAULT_POLICY:
-                return SetDefaultPolicy
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _STATEMENT_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 @dataclass
@@ -204,3 +193,13 @@ class SetDefaultPolicy(
 ):
     policy_name: str
     ty: str = field(default="SetDefaultPolicy", init=False)
+
+
+_STATEMENT_CLASSES: dict[StatementType, type] = {
+    StatementType.SKIP: SkipStatement,
+    StatementType.SEQ: SeqStatement,
+    StatementType.IF: IfStatement,
+    StatementType.ASSIGN: AssignStatement,
+    StatementType.RETURN: ReturnStatement,
+    StatementType.SET_DEFAULT_POLICY: SetDefaultPolicy,
+}
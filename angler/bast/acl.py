@@ -3,13 +3,13 @@
 Expressions for filtering routes and using access lists in Batfish.
 """
 from ipaddress import IPv4Network, IPv6Network
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from angler.serialize import Serialize, Field
 import angler.bast.btypes as types
 import angler.util
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteFilterLine(
     angler.util.ASTNode,
     Serialize,
@@ -24,7 +24,7 @@ class RouteFilterLine(
     length_range: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Route6FilterLine(
     angler.util.ASTNode,
     Serialize,
@@ -37,29 +37,29 @@ class Route6FilterLine(
     length_range: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteFilterList(
     angler.util.ASTNode,
     Serialize,
     _name="name",
-    lines=Field("lines", list[RouteFilterLine], []),
+    lines=Field("lines", tuple[RouteFilterLine, ...], ()),
 ):
     _name: str
-    lines: list[RouteFilterLine] = field(default_factory=list)
+    lines: tuple[RouteFilterLine, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Route6FilterList(
     angler.util.ASTNode,
     Serialize,
     _name="name",
-    lines=Field("lines", list[Route6FilterLine], []),
+    lines=Field("lines", tuple[Route6FilterLine, ...], ()),
 ):
     _name: str
-    lines: list[Route6FilterLine] = field(default_factory=list)
+    lines: tuple[Route6FilterLine, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class AclLine(
     angler.util.ASTNode,
     Serialize,
@@ -77,16 +77,16 @@ class AclLine(
     vendor_id: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Acl(
     angler.util.ASTNode,
     Serialize,
     _name="name",
     srcname="sourceName",
     srctype="sourceType",
-    lines=Field("lines", list[AclLine]),
+    lines=Field("lines", tuple[AclLine, ...], ()),
 ):
     _name: str
     srcname: str
     srctype: str
-    lines: list[AclLine]
+    lines: tuple[AclLine, ...]
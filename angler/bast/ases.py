@@ -15,13 +15,10 @@ class AsExprType(angler.util.Variant):
     LAST_AS = "LastAs"
 
     def as_class(self) -> type:
-        match self:
-            case AsExprType.LAST_AS:
-                return LastAs
-            case AsExprType.EXPLICIT_AS:
-                return ExplicitAs
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _AS_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class AsPathListExprType(angler.util.Variant):
@@ -29,35 +26,30 @@ class AsPathListExprType(angler.util.Variant):
     MULTIPLIED_AS = "MultipliedAs"
 
     def as_class(self) -> type:
-        match self:
-            case AsPathListExprType.LITERAL_AS_LIST:
-                return LiteralAsList
-            case AsPathListExprType.MULTIPLIED_AS:
-                return MultipliedAs
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _AS_PATH_LIST_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class AsPathSetExprType(angler.util.Variant):
     EXPLICIT_AS_PATH_SET = "ExplicitAsPathSet"
 
     def as_class(self) -> type:
-        match self:
-            case AsPathSetExprType.EXPLICIT_AS_PATH_SET:
-                return ExplicitAsPathSet
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _AS_PATH_SET_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class AsPathExprType(angler.util.Variant):
     INPUT_AS_PATH = "InputAsPath"
 
     def as_class(self) -> type:
-        match self:
-            case AsPathExprType.INPUT_AS_PATH:
-                return InputAsPath
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _AS_PATH_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class AsPathMatchExprType(angler.util.Variant):
@@ -65,57 +57,54 @@ class AsPathMatchExprType(angler.util.Variant):
     HAS_AS_PATH_LENGTH = "HasAsPathLength"
 
     def as_class(self) -> type:
-        match self:
-            case AsPathMatchExprType.AS_PATH_MATCH_REGEX:
-                return AsPathMatchRegex
-            case AsPathMatchExprType.HAS_AS_PATH_LENGTH:
-                return HasAsPathLength
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _AS_PATH_MATCH_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
-@dataclass
+@dataclass(slots=True)
 class AsExpr(expr.Expression, Serialize, delegate=("class", AsExprType.parse_class)):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AsPathListExpr(
     expr.Expression, Serialize, delegate=("class", AsPathListExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AsPathExpr(
     expr.Expression, Serialize, delegate=("class", AsPathExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AsPathSetExpr(
     expr.Expression, Serialize, delegate=("class", AsPathSetExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LastAs(AsExpr, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplicitAs(AsExpr, Serialize, asnum=Field("as", int)):
     asnum: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RegexAsPathSetElem(expr.Expression, Serialize, regex="regex"):
     regex: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplicitAsPathSet(
     AsPathSetExpr, Serialize, elems=Field("elems", list[RegexAsPathSetElem])
 ):
@@ -126,12 +115,12 @@ class ExplicitAsPathSet(
     elems: list[RegexAsPathSetElem]
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralAsList(AsPathListExpr, Serialize, ases=Field("list", list[AsExpr])):
     ases: list[AsExpr]
 
 
-@dataclass
+@dataclass(slots=True)
 class MultipliedAs(
     AsPathListExpr,
     Serialize,
@@ -142,27 +131,55 @@ class MultipliedAs(
     n: ints.IntExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class InputAsPath(AsPathExpr, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AsPathMatchExpr(
     expr.Expression, Serialize, delegate=("class", AsPathMatchExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AsPathMatchRegex(AsPathMatchExpr, Serialize, regex=Field("regex", str)):
     regex: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HasAsPathLength(
     AsPathMatchExpr, Serialize, comparison=Field("comparison", preds.IntComparison)
 ):
     """Represents a test that the given AS path's length matches some comparison predicate."""
 
     comparison: preds.IntComparison
+
+
+_AS_EXPR_CLASSES: dict[AsExprType, type] = {
+    AsExprType.LAST_AS: LastAs,
+    AsExprType.EXPLICIT_AS: ExplicitAs,
+}
+
+
+_AS_PATH_LIST_EXPR_CLASSES: dict[AsPathListExprType, type] = {
+    AsPathListExprType.LITERAL_AS_LIST: LiteralAsList,
+    AsPathListExprType.MULTIPLIED_AS: MultipliedAs,
+}
+
+
+_AS_PATH_SET_EXPR_CLASSES: dict[AsPathSetExprType, type] = {
+    AsPathSetExprType.EXPLICIT_AS_PATH_SET: ExplicitAsPathSet,
+}
+
+
+_AS_PATH_EXPR_CLASSES: dict[AsPathExprType, type] = {
+    AsPathExprType.INPUT_AS_PATH: InputAsPath,
+}
+
+
+_AS_PATH_MATCH_EXPR_CLASSES: dict[AsPathMatchExprType, type] = {
+    AsPathMatchExprType.AS_PATH_MATCH_REGEX: AsPathMatchRegex,
+    AsPathMatchExprType.HAS_AS_PATH_LENGTH: HasAsPathLength,
+}
@@ -14,7 +14,7 @@ class RemoteIpType(Enum):
     IP = "Ip"
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteIpAddress(
     Serialize, value=Field("value", IPv4Address), schema=Field("schema", RemoteIpType)
 ):
@@ -22,7 +22,7 @@ class RemoteIpAddress(
     value: IPv4Address
 
 
-@dataclass
+@dataclass(slots=True)
 class BgpPeerConfig(
     angler.util.ASTNode,
     Serialize,
@@ -32,8 +32,8 @@ class BgpPeerConfig(
     local_ip=Field("Local_IP", IPv4Address),
     remote_as=Field("Remote_AS", int),
     remote_ip=Field("Remote_IP", RemoteIpAddress),
-    import_policy=Field("Import_Policy", list[str]),
-    export_policy=Field("Export_Policy", list[str]),
+    import_policy=Field("Import_Policy", tuple[str, ...], ()),
+    export_policy=Field("Export_Policy", tuple[str, ...], ()),
 ):
     desc: str
     node: topology.Node
@@ -41,11 +41,11 @@ class BgpPeerConfig(
     local_ip: IPv4Address
     remote_as: int
     remote_ip: RemoteIpAddress
-    import_policy: list[str]
-    export_policy: list[str]
+    import_policy: tuple[str, ...]
+    export_policy: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class OwnedIP(
     angler.util.ASTNode,
     Serialize,
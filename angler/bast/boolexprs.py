@@ -2,8 +2,8 @@
 """
 Boolean expressions in the Batfish AST.
 """
-from dataclasses import dataclass, field
-from enum import Enum
+from dataclasses import dataclass
+from enum import StrEnum
 from angler.serialize import Serialize, Field
 import angler.bast.expression as expr
 import angler.bast.communities as comms
@@ -14,7 +14,7 @@ import angler.bast.longexprs as longs
 import angler.util
 
 
-class StaticBooleanExprType(Enum):
+class StaticBooleanExprType(StrEnum):
     CALLCONTEXT = "CallExprContext"
     FALSE = "False"
     TRUE = "True"
@@ -39,41 +39,10 @@ class BooleanExprType(angler.util.Variant):
     CALL_EXPR = "CallExpr"
 
     def as_class(self) -> type:
-        match self:
-            case BooleanExprType.STATIC:
-                return StaticBooleanExpr
-            case BooleanExprType.CONJUNCTION:
-                return Conjunction
-            case BooleanExprType.CONJUNCTION_CHAIN:
-                return ConjunctionChain
-            case BooleanExprType.DISJUNCTION:
-                return Disjunction
-            case BooleanExprType.NOT:
-                return Not
-            case BooleanExprType.LEGACY_MATCH_AS_PATH:
-                return LegacyMatchAsPath
-            case BooleanExprType.MATCH_AS_PATH:
-                return MatchAsPath
-            case BooleanExprType.MATCH_TAG:
-                return MatchTag
-            case BooleanExprType.MATCH_COMMUNITIES:
-                return MatchCommunities
-            case BooleanExprType.MATCH_PREFIXES:
-                return MatchPrefixSet
-            case BooleanExprType.MATCH_PREFIXES6:
-                return MatchPrefix6Set
-            case BooleanExprType.MATCH_PROTOCOL:
-                return MatchProtocol
-            case BooleanExprType.MATCH_IPV4:
-                return MatchIpv4
-            case BooleanExprType.MATCH_IPV6:
-                return MatchIpv6
-            case BooleanExprType.FIRST_MATCH_CHAIN:
-                return FirstMatchChain
-            case BooleanExprType.CALL_EXPR:
-                return CallExpr
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _BOOLEAN_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class BooleanExpr(
@@ -81,24 +50,26 @@ class BooleanExpr(
     Serialize,
     delegate=("class", BooleanExprType.parse_class),
 ):
-    ...
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticBooleanExpr(
-    BooleanExpr, Serialize, ty=Field("type", StaticBooleanExprType)
+    BooleanExpr,
+    Serialize,
+    ty=Field("type", StaticBooleanExprType),
 ):
     ty: StaticBooleanExprType
 
 
-@dataclass
+@dataclass(slots=True)
 class Conjunction(
     BooleanExpr, Serialize, conjuncts=Field("conjuncts", list[BooleanExpr])
 ):
     conjuncts: list[BooleanExpr]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConjunctionChain(
     BooleanExpr, Serialize, subroutines=Field("subroutines", list[BooleanExpr])
 ):
@@ -115,19 +86,19 @@ class ConjunctionChain(
     subroutines: list[BooleanExpr]
 
 
-@dataclass
+@dataclass(slots=True)
 class Disjunction(
     BooleanExpr, Serialize, disjuncts=Field("disjuncts", list[BooleanExpr])
 ):
     disjuncts: list[BooleanExpr]
 
 
-@dataclass
+@dataclass(slots=True)
 class Not(BooleanExpr, Serialize, expr=Field("expr", BooleanExpr)):
     expr: BooleanExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCommunities(
     BooleanExpr,
     Serialize,
@@ -140,7 +111,7 @@ class MatchCommunities(
     _comms_match: comms.CommunitySetMatchExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class LegacyMatchAsPath(
     BooleanExpr,
     Serialize,
@@ -149,7 +120,7 @@ class LegacyMatchAsPath(
     expr: ases.AsPathSetExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchAsPath(
     BooleanExpr,
     Serialize,
@@ -160,7 +131,7 @@ class MatchAsPath(
     match_expr: ases.AsPathSetExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchPrefixSet(
     BooleanExpr,
     Serialize,
@@ -171,7 +142,7 @@ class MatchPrefixSet(
     _prefixes: prefix.PrefixSetExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchPrefix6Set(
     BooleanExpr,
     Serialize,
@@ -182,7 +153,7 @@ class MatchPrefix6Set(
     _prefixes: prefix.PrefixSetExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchIpv6(
     BooleanExpr,
     Serialize,
@@ -190,7 +161,7 @@ class MatchIpv6(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchIpv4(
     BooleanExpr,
     Serialize,
@@ -198,14 +169,14 @@ class MatchIpv4(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchProtocol(
     BooleanExpr, Serialize, protocols=Field("protocols", list[types.Protocol])
 ):
     protocols: list[types.Protocol]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchTag(
     BooleanExpr,
     Serialize,
@@ -216,11 +187,11 @@ class MatchTag(
     tag: longs.LongExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class FirstMatchChain(
     BooleanExpr,
     Serialize,
-    subroutines=Field("subroutines", list[BooleanExpr], default=[]),
+    subroutines=Field("subroutines", tuple[BooleanExpr, ...], default=()),
 ):
     """
     From the Batfish docs:
@@ -234,13 +205,33 @@ class FirstMatchChain(
     """
 
     # defaults to empty if the field is not provided
-    subroutines: list[BooleanExpr] = field(default_factory=list)
+    subroutines: tuple[BooleanExpr, ...] = ()
 
 
-@dataclass
-class CallExpr(BooleanExpr, Serialize, policy="calledPolicyName"):
+@dataclass(slots=True)
+class CallExpr(BooleanExpr, Serialize, policy=Field("calledPolicyName", str)):
     """
     Call the given policy.
     """
 
     policy: str
+
+
+_BOOLEAN_EXPR_CLASSES: dict[BooleanExprType, type] = {
+    BooleanExprType.STATIC: StaticBooleanExpr,
+    BooleanExprType.CONJUNCTION: Conjunction,
+    BooleanExprType.CONJUNCTION_CHAIN: ConjunctionChain,
+    BooleanExprType.DISJUNCTION: Disjunction,
+    BooleanExprType.NOT: Not,
+    BooleanExprType.LEGACY_MATCH_AS_PATH: LegacyMatchAsPath,
+    BooleanExprType.MATCH_AS_PATH: MatchAsPath,
+    BooleanExprType.MATCH_TAG: MatchTag,
+    BooleanExprType.MATCH_COMMUNITIES: MatchCommunities,
+    BooleanExprType.MATCH_PREFIXES: MatchPrefixSet,
+    BooleanExprType.MATCH_PREFIXES6: MatchPrefix6Set,
+    BooleanExprType.MATCH_PROTOCOL: MatchProtocol,
+    BooleanExprType.MATCH_IPV4: MatchIpv4,
+    BooleanExprType.MATCH_IPV6: MatchIpv6,
+    BooleanExprType.FIRST_MATCH_CHAIN: FirstMatchChain,
+    BooleanExprType.CALL_EXPR: CallExpr,
+}
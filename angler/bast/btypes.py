@@ -2,17 +2,17 @@
 """
 Other Batfish AST types.
 """
-from enum import Enum
+from enum import Enum, StrEnum
 
 
-class Action(Enum):
+class Action(StrEnum):
     """An action to perform on routes."""
 
     PERMIT = "PERMIT"
     DENY = "DENY"
 
 
-class Protocol(Enum):
+class Protocol(StrEnum):
     BGP = "bgp"
     IBGP = "ibgp"
     OSPF = "ospf"
@@ -43,7 +43,7 @@ class OriginType(Enum):
                 raise ValueError(f"No integer representation for origin type {self}")
 
 
-class Comparator(Enum):
+class Comparator(StrEnum):
     EQ = "EQ"
     GE = "GE"
     GT = "GT"
@@ -25,19 +25,10 @@ class CommunitySetExprType(angler.util.Variant):
     COMMUNITIES_REF = "CommunitySetReference"
 
     def as_class(self) -> type:
-        match self:
-            case CommunitySetExprType.INPUT_COMMUNITIES:
-                return InputCommunities
-            case CommunitySetExprType.LITERAL_COMMUNITIES:
-                return LiteralCommunitySet
-            case CommunitySetExprType.COMMUNITY_UNION:
-                return CommunitySetUnion
-            case CommunitySetExprType.COMMUNITY_DIFFERENCE:
-                return CommunitySetDifference
-            case CommunitySetExprType.COMMUNITIES_REF:
-                return CommunitySetReference
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _COMMUNITY_SET_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class CommunityMatchExprType(angler.util.Variant):
@@ -47,17 +38,10 @@ class CommunityMatchExprType(angler.util.Variant):
     ALL_STANDARD = "AllStandardCommunities"
 
     def as_class(self) -> type:
-        match self:
-            case CommunityMatchExprType.COMMUNITY_MATCH_REF:
-                return CommunityMatchExprReference
-            case CommunityMatchExprType.COMMUNITY_IS:
-                return CommunityIs
-            case CommunityMatchExprType.COMMUNITY_MATCH_REGEX:
-                return CommunityMatchRegex
-            case CommunityMatchExprType.ALL_STANDARD:
-                return AllStandardCommunities
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _COMMUNITY_MATCH_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class CommunitySetMatchExprType(angler.util.Variant):
@@ -66,15 +50,10 @@ class CommunitySetMatchExprType(angler.util.Variant):
     HAS_COMMUNITY = "HasCommunity"
 
     def as_class(self) -> type:
-        match self:
-            case CommunitySetMatchExprType.COMMUNITIES_MATCH_REF:
-                return CommunitySetMatchExprReference
-            case CommunitySetMatchExprType.COMMUNITY_SET_MATCH_ALL:
-                return CommunitySetMatchAll
-            case CommunitySetMatchExprType.HAS_COMMUNITY:
-                return HasCommunity
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _COMMUNITY_SET_MATCH_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class RenderingType(angler.util.Variant):
@@ -82,16 +61,13 @@ class RenderingType(angler.util.Variant):
     INTVAL = "IntegerValueRendering"
 
     def as_class(self) -> type:
-        match self:
-            case RenderingType.COLONSEP:
-                return ColonSeparatedRendering
-            case _:
-                raise NotImplementedError(
-                    f"Rendering class for {self} not implemented."
-                )
+        ty = _RENDERING_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"Rendering class for {self} not implemented.")
+        return ty
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunityRendering(
     angler.util.ASTNode,
     Serialize,
@@ -103,12 +79,12 @@ class CommunityRendering(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ColonSeparatedRendering(CommunityRendering, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunitySetExpr(
     expr.Expression, Serialize, delegate=("class", CommunitySetExprType.parse_class)
 ):
@@ -117,7 +93,7 @@ class CommunitySetExpr(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunityMatchExpr(
     expr.Expression,
     Serialize,
@@ -128,7 +104,7 @@ class CommunityMatchExpr(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunitySetMatchExpr(
     expr.Expression,
     Serialize,
@@ -139,7 +115,7 @@ class CommunitySetMatchExpr(
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class HasCommunity(
     CommunitySetMatchExpr, Serialize, expr=Field("expr", CommunityMatchExpr)
 ):
@@ -148,7 +124,7 @@ class HasCommunity(
     expr: CommunityMatchExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunitySetMatchAll(
     CommunitySetMatchExpr, Serialize, exprs=Field("exprs", list[CommunitySetMatchExpr])
 ):
@@ -160,15 +136,25 @@ class CommunitySetMatchAll(
 
     exprs: list[CommunitySetMatchExpr]
 
+    def __post_init__(self):
+        # conjunction is associative, so splice in any nested CommunitySetMatchAlls
+        if self.exprs:
+            self.exprs = _flatten_nested(self.exprs, CommunitySetMatchAll)
 
-@dataclass
+
+@dataclass(slots=True)
 class CommunitySetUnion(
     CommunitySetExpr, Serialize, exprs=Field("exprs", list[CommunitySetExpr])
 ):
     exprs: list[CommunitySetExpr]
 
+    def __post_init__(self):
+        # union is associative, so splice in any nested CommunitySetUnions
+        if self.exprs:
+            self.exprs = _flatten_nested(self.exprs, CommunitySetUnion)
+
 
-@dataclass
+@dataclass(slots=True)
 class CommunitySetDifference(
     CommunitySetExpr,
     Serialize,
@@ -179,12 +165,12 @@ class CommunitySetDifference(
     remove: CommunityMatchExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class InputCommunities(CommunitySetExpr, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralCommunitySet(
     CommunitySetExpr, Serialize, comms=Field("communitySet", list[str])
 ):
@@ -192,39 +178,88 @@ class LiteralCommunitySet(
     comms: list[str]
 
 
-@dataclass
-class CommunityIs(CommunityMatchExpr, Serialize, community="community"):
+@dataclass(slots=True)
+class CommunityIs(CommunityMatchExpr, Serialize, community=Field("community", str)):
     # TODO parse the community set: it appears to be two integers separated by a colon
     community: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunityMatchRegex(
     CommunityMatchExpr,
     Serialize,
     rendering=Field("communityRendering", CommunityRendering),
-    regex="regex",
+    regex=Field("regex", str),
 ):
     rendering: CommunityRendering
     # TODO parse
     regex: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AllStandardCommunities(CommunityMatchExpr, Serialize):
     ...
 
 
-@dataclass
-class CommunitySetReference(CommunitySetExpr, Serialize, _name="name"):
+@dataclass(slots=True)
+class CommunitySetReference(CommunitySetExpr, Serialize, _name=Field("name", str)):
     _name: str
 
 
-@dataclass
-class CommunityMatchExprReference(CommunityMatchExpr, Serialize, _name="name"):
+@dataclass(slots=True)
+class CommunityMatchExprReference(
+    CommunityMatchExpr, Serialize, _name=Field("name", str)
+):
     _name: str
 
 
-@dataclass
-class CommunitySetMatchExprReference(CommunitySetMatchExpr, Serialize, _name="name"):
+@dataclass(slots=True)
+class CommunitySetMatchExprReference(
+    CommunitySetMatchExpr, Serialize, _name=Field("name", str)
+):
     _name: str
+
+
+def _flatten_nested(exprs: list, cls: type) -> list:
+    """
+    Return exprs with any elements of type cls replaced by their own exprs.
+    Elements of type cls are assumed to have been flattened already (when constructed).
+    """
+    if not any(isinstance(e, cls) for e in exprs):
+        return exprs
+    flat = []
+    for e in exprs:
+        if isinstance(e, cls):
+            flat.extend(e.exprs)
+        else:
+            flat.append(e)
+    return flat
+
+
+_COMMUNITY_SET_EXPR_CLASSES: dict[CommunitySetExprType, type] = {
+    CommunitySetExprType.INPUT_COMMUNITIES: InputCommunities,
+    CommunitySetExprType.LITERAL_COMMUNITIES: LiteralCommunitySet,
+    CommunitySetExprType.COMMUNITY_UNION: CommunitySetUnion,
+    CommunitySetExprType.COMMUNITY_DIFFERENCE: CommunitySetDifference,
+    CommunitySetExprType.COMMUNITIES_REF: CommunitySetReference,
+}
+
+
+_COMMUNITY_MATCH_EXPR_CLASSES: dict[CommunityMatchExprType, type] = {
+    CommunityMatchExprType.COMMUNITY_MATCH_REF: CommunityMatchExprReference,
+    CommunityMatchExprType.COMMUNITY_IS: CommunityIs,
+    CommunityMatchExprType.COMMUNITY_MATCH_REGEX: CommunityMatchRegex,
+    CommunityMatchExprType.ALL_STANDARD: AllStandardCommunities,
+}
+
+
+_COMMUNITY_SET_MATCH_EXPR_CLASSES: dict[CommunitySetMatchExprType, type] = {
+    CommunitySetMatchExprType.COMMUNITIES_MATCH_REF: CommunitySetMatchExprReference,
+    CommunitySetMatchExprType.COMMUNITY_SET_MATCH_ALL: CommunitySetMatchAll,
+    CommunitySetMatchExprType.HAS_COMMUNITY: HasCommunity,
+}
+
+
+_RENDERING_CLASSES: dict[RenderingType, type] = {
+    RenderingType.COLONSEP: ColonSeparatedRendering,
+}
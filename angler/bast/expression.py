@@ -14,7 +14,7 @@ class ExprType(angler.util.Variant):
         raise NotImplementedError(f"{self} conversion not implemented.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(
     angler.util.ASTNode,
     Serialize,
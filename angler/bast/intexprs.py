@@ -12,18 +12,22 @@ class IntExprType(angler.util.Variant):
     LITERAL_INT = "LiteralInt"
 
     def as_class(self) -> type:
-        match self:
-            case IntExprType.LITERAL_INT:
-                return LiteralInt
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _INT_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
-@dataclass
+@dataclass(slots=True)
 class IntExpr(expr.Expression, Serialize, delegate=("class", IntExprType.parse_class)):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralInt(IntExpr, Serialize, value=Field("value", int)):
     value: int
+
+
+_INT_EXPR_CLASSES: dict[IntExprType, type] = {
+    IntExprType.LITERAL_INT: LiteralInt,
+}
@@ -3,6 +3,7 @@
 The top-level JSON AST obtained from Batfish.
 """
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any
 from angler.serialize import Serialize, Field
 import angler.bast.base as base
@@ -17,7 +18,7 @@ def collect_rows(answer: answer.TableAnswer) -> list[dict[str, Any]]:
     """
     Return the rows of the answers in the given TableAnswer.
     """
-    return [row for a in answer["answerElements"] for row in a["rows"]]
+    return list(chain.from_iterable(a["rows"] for a in answer["answerElements"]))
 
 
 def query_session(session: session.Session) -> dict[str, list[dict]]:
@@ -41,16 +42,17 @@ def query_session(session: session.Session) -> dict[str, list[dict]]:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatfishJson(
     angler.util.ASTNode,
     Serialize,
     topology=Field("topology", list[topology.Edge]),
     ips=Field("ips", list[base.OwnedIP]),
-    policy=Field("policy", list[dict]),
+    # policy and issues are kept as the rows given, without converting each row
+    policy=Field("policy"),
     # bgp=Field("bgp", list[base.BgpPeerConfig]),
     declarations=Field("declarations", list[struct.Structure]),
-    issues=Field("issues", list[dict]),
+    issues=Field("issues"),
 ):
     topology: list[topology.Edge]
     ips: list[base.OwnedIP]
@@ -14,34 +14,36 @@ class LongExprType(angler.util.Variant):
     INCREMENT_LOCAL_PREF = "IncrementLocalPreference"
 
     def as_class(self) -> type:
-        match self:
-            case LongExprType.LITERAL_LONG:
-                return LiteralLong
-            case LongExprType.DECREMENT_LOCAL_PREF:
-                return DecrementLocalPref
-            case LongExprType.INCREMENT_LOCAL_PREF:
-                return IncrementLocalPref
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
-
-
-@dataclass
+        ty = _LONG_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
+
+
+@dataclass(slots=True)
 class LongExpr(
     expr.Expression, Serialize, delegate=("class", LongExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralLong(LongExpr, Serialize, value=Field("value", int)):
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class IncrementLocalPref(LongExpr, Serialize, addend=Field("addend", int)):
     addend: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DecrementLocalPref(LongExpr, Serialize, subtrahend=Field("subtrahend", int)):
     subtrahend: int
+
+
+_LONG_EXPR_CLASSES: dict[LongExprType, type] = {
+    LongExprType.LITERAL_LONG: LiteralLong,
+    LongExprType.DECREMENT_LOCAL_PREF: DecrementLocalPref,
+    LongExprType.INCREMENT_LOCAL_PREF: IncrementLocalPref,
+}
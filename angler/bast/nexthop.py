@@ -15,35 +15,37 @@ class NextHopExprType(angler.util.Variant):
     IP_NEXT_HOP = "IpNextHop"
 
     def as_class(self):
-        match self:
-            case NextHopExprType.SELF_NEXT_HOP:
-                return SelfNextHop
-            case NextHopExprType.DISCARD_NEXT_HOP:
-                return DiscardNextHop
-            case NextHopExprType.IP_NEXT_HOP:
-                return IpNextHop
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
-
-
-@dataclass
+        ty = _NEXT_HOP_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
+
+
+@dataclass(slots=True)
 class NextHopExpr(
     expr.Expression, Serialize, delegate=("class", NextHopExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class IpNextHop(NextHopExpr, Serialize, ips=Field("ips", list[IPv4Address])):
     # NOTE: Batfish only handles a single-element ips list.
     ips: list[IPv4Address]
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfNextHop(NextHopExpr, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscardNextHop(NextHopExpr, Serialize):
     ...
+
+
+_NEXT_HOP_EXPR_CLASSES: dict[NextHopExprType, type] = {
+    NextHopExprType.SELF_NEXT_HOP: SelfNextHop,
+    NextHopExprType.DISCARD_NEXT_HOP: DiscardNextHop,
+    NextHopExprType.IP_NEXT_HOP: IpNextHop,
+}
@@ -13,22 +13,28 @@ class OriginExprType(angler.util.Variant):
     LITERAL_ORIGIN = "LiteralOrigin"
 
     def as_class(self):
-        match self:
-            case OriginExprType.LITERAL_ORIGIN:
-                return LiteralOrigin
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _ORIGIN_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
-@dataclass
+@dataclass(slots=True)
 class OriginExpr(
     expr.Expression, Serialize, delegate=("class", OriginExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralOrigin(
-    OriginExpr, Serialize, origin_type=Field("originType", types.OriginType)
+    OriginExpr,
+    Serialize,
+    origin_type=Field("originType", types.OriginType),
 ):
     origin_type: types.OriginType
+
+
+_ORIGIN_EXPR_CLASSES: dict[OriginExprType, type] = {
+    OriginExprType.LITERAL_ORIGIN: LiteralOrigin,
+}
@@ -15,21 +15,20 @@ class PredicateExprType(angler.util.Variant):
     INT_COMPARISON = "IntComparison"
 
     def as_class(self) -> type:
-        match self:
-            case PredicateExprType.INT_COMPARISON:
-                return IntComparison
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _PREDICATE_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanPredicateExpr(
     expr.Expression, Serialize, delegate=("class", PredicateExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class IntComparison(
     BooleanPredicateExpr,
     Serialize,
@@ -40,3 +39,8 @@ class IntComparison(
 
     comparator: types.Comparator
     expr: ints.IntExpr
+
+
+_PREDICATE_EXPR_CLASSES: dict[PredicateExprType, type] = {
+    PredicateExprType.INT_COMPARISON: IntComparison,
+}
@@ -14,13 +14,10 @@ class PrefixExprType(angler.util.Variant):
     DESTINATION6 = "DestinationNetwork6"  # variable
 
     def as_class(self) -> type:
-        match self:
-            case PrefixExprType.DESTINATION:
-                return DestinationNetwork
-            case PrefixExprType.DESTINATION6:
-                return DestinationNetwork6
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _PREFIX_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class PrefixSetExprType(angler.util.Variant):
@@ -29,53 +26,61 @@ class PrefixSetExprType(angler.util.Variant):
     EXPLICIT_PREFIX_SET = "ExplicitPrefixSet"
 
     def as_class(self) -> type:
-        match self:
-            case PrefixSetExprType.NAMED_PREFIX_SET:
-                return NamedPrefixSet
-            case PrefixSetExprType.NAMED_PREFIX6_SET:
-                return NamedPrefix6Set
-            case PrefixSetExprType.EXPLICIT_PREFIX_SET:
-                return ExplicitPrefixSet
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
-
-
-@dataclass
+        ty = _PREFIX_SET_EXPR_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
+
+
+@dataclass(slots=True)
 class PrefixExpr(
     expr.Expression, Serialize, delegate=("class", PrefixExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class PrefixSetExpr(
     expr.Expression, Serialize, delegate=("class", PrefixSetExprType.parse_class)
 ):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class DestinationNetwork(PrefixExpr, Serialize):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class DestinationNetwork6(PrefixExpr, Serialize):
     ...
 
 
-@dataclass
-class NamedPrefixSet(PrefixSetExpr, Serialize, _name="name"):
+@dataclass(slots=True)
+class NamedPrefixSet(PrefixSetExpr, Serialize, _name=Field("name", str)):
     _name: str
 
 
-@dataclass
-class NamedPrefix6Set(PrefixSetExpr, Serialize, _name="name"):
+@dataclass(slots=True)
+class NamedPrefix6Set(PrefixSetExpr, Serialize, _name=Field("name", str)):
     _name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplicitPrefixSet(
     PrefixSetExpr, Serialize, prefix_space=Field("prefixSpace", list[IPv4Network])
 ):
     prefix_space: list[IPv4Network]
+
+
+_PREFIX_EXPR_CLASSES: dict[PrefixExprType, type] = {
+    PrefixExprType.DESTINATION: DestinationNetwork,
+    PrefixExprType.DESTINATION6: DestinationNetwork6,
+}
+
+
+_PREFIX_SET_EXPR_CLASSES: dict[PrefixSetExprType, type] = {
+    PrefixSetExprType.NAMED_PREFIX_SET: NamedPrefixSet,
+    PrefixSetExprType.NAMED_PREFIX6_SET: NamedPrefix6Set,
+    PrefixSetExprType.EXPLICIT_PREFIX_SET: ExplicitPrefixSet,
+}
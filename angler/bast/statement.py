@@ -29,31 +29,10 @@ class StatementType(angler.util.Variant):
     TRACEABLE = "TraceableStatement"
 
     def as_class(self) -> type:
-        match self:
-            case StatementType.IF:
-                return IfStatement
-            case StatementType.PREPEND_AS:
-                return PrependAsPath
-            case StatementType.SET_COMMS:
-                return SetCommunities
-            case StatementType.SET_LP:
-                return SetLocalPreference
-            case StatementType.SET_METRIC:
-                return SetMetric
-            case StatementType.SET_NEXT_HOP:
-                return SetNextHop
-            case StatementType.SET_ORIGIN:
-                return SetOrigin
-            case StatementType.SET_WEIGHT:
-                return SetWeight
-            case StatementType.SET_DEFAULT_POLICY:
-                return SetDefaultPolicy
-            case StatementType.STATIC:
-                return StaticStatement
-            case StatementType.TRACEABLE:
-                return TraceableStatement
-            case _:
-                raise NotImplementedError(f"{self} conversion not implemented.")
+        ty = _STATEMENT_CLASSES.get(self)
+        if ty is None:
+            raise NotImplementedError(f"{self} conversion not implemented.")
+        return ty
 
 
 class StaticStatementType(Enum):
@@ -70,7 +49,7 @@ class StaticStatementType(Enum):
     FALL_THROUGH = "FallThrough"
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement(
     angler.util.ASTNode,
     Serialize,
@@ -81,16 +60,16 @@ class Statement(
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticStatement(Statement, Serialize, ty=Field("type", StaticStatementType)):
     ty: StaticStatementType
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceableStatement(
     Statement,
     Serialize,
-    inner=Field("innerStatements", list[Statement], []),
+    inner=Field("innerStatements", tuple[Statement, ...], ()),
     trace_elem=Field("traceElement"),
 ):
     """
@@ -98,17 +77,17 @@ class TraceableStatement(
     TODO: can we check if there are legitimate situations in which having no inner statements is sensible?
     """
 
-    inner: list[Statement]
+    inner: tuple[Statement, ...]
     trace_elem: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(
     Statement,
     Serialize,
     guard=Field("guard", bools.BooleanExpr),
-    true_stmts=Field("trueStatements", list[Statement], []),
-    false_stmts=Field("falseStatements", list[Statement], []),
+    true_stmts=Field("trueStatements", tuple[Statement, ...], ()),
+    false_stmts=Field("falseStatements", tuple[Statement, ...], ()),
     comment="comment",
 ):
     """
@@ -118,49 +97,64 @@ class IfStatement(
 
     comment: str
     guard: bools.BooleanExpr
-    true_stmts: list[Statement]
-    false_stmts: list[Statement]
+    true_stmts: tuple[Statement, ...]
+    false_stmts: tuple[Statement, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class SetLocalPreference(
     Statement, Serialize, lp=Field("localPreference", longs.LongExpr)
 ):
     lp: longs.LongExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetCommunities(
     Statement, Serialize, comm_set=Field("communitySetExpr", comms.CommunitySetExpr)
 ):
     comm_set: comms.CommunitySetExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class PrependAsPath(Statement, Serialize, expr=Field("expr", ases.AsPathListExpr)):
     expr: ases.AsPathListExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetMetric(Statement, Serialize, metric=Field("metric", longs.LongExpr)):
     metric: longs.LongExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetNextHop(Statement, Serialize, expr=Field("expr", hop.NextHopExpr)):
     expr: hop.NextHopExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetOrigin(Statement, Serialize, expr=Field("originType", origin.OriginExpr)):
     expr: origin.OriginExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetWeight(Statement, Serialize, expr=Field("weight", ints.IntExpr)):
     expr: ints.IntExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultPolicy(Statement, Serialize, policy=Field("defaultPolicy", str)):
     policy: str
+
+
+_STATEMENT_CLASSES: dict[StatementType, type] = {
+    StatementType.IF: IfStatement,
+    StatementType.PREPEND_AS: PrependAsPath,
+    StatementType.SET_COMMS: SetCommunities,
+    StatementType.SET_LP: SetLocalPreference,
+    StatementType.SET_METRIC: SetMetric,
+    StatementType.SET_NEXT_HOP: SetNextHop,
+    StatementType.SET_ORIGIN: SetOrigin,
+    StatementType.SET_WEIGHT: SetWeight,
+    StatementType.SET_DEFAULT_POLICY: SetDefaultPolicy,
+    StatementType.STATIC: StaticStatement,
+    StatementType.TRACEABLE: TraceableStatement,
+}
@@ -4,7 +4,7 @@ Structure definitions in the Batfish AST.
 """
 from dataclasses import dataclass
 from angler.serialize import Serialize, Field
-from typing import cast
+from typing import Any, Callable
 import angler.bast.statement as stmt
 import angler.bast.communities as comms
 import angler.bast.topology as topology
@@ -13,18 +13,18 @@ import angler.bast.vrf as vrf
 import angler.util
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingPolicy(
     angler.util.ASTNode,
     Serialize,
-    policyname="name",
-    statements=Field("statements", list[stmt.Statement]),
+    policyname=Field("name", str),
+    statements=Field("statements", tuple[stmt.Statement, ...]),
 ):
     policyname: str
-    statements: list[stmt.Statement]
+    statements: tuple[stmt.Statement, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureDef(angler.util.ASTNode, Serialize, value=Field("value", dict)):
     """
     A structure definition of some particular value, based on the
@@ -44,24 +44,13 @@ class StructureType(angler.util.Variant):
     VRF = "VRF"
 
     def as_class(self) -> type:
-        match self:
-            case StructureType.COMMS_MATCH:
-                return comms.CommunitySetMatchExpr
-            case StructureType.IP_ACCESS_LIST:
-                return acl.Acl
-            case StructureType.ROUTE_FILTER_LIST:
-                return acl.RouteFilterList
-            case StructureType.ROUTE6_FILTER_LIST:
-                return acl.Route6FilterList
-            case StructureType.ROUTING_POLICY:
-                return RoutingPolicy
-            case StructureType.VRF:
-                return vrf.Vrf
-            case _:
-                raise ValueError(f"{self} is not a valid {self.__class__}")
-
-
-@dataclass
+        ty = _STRUCTURE_CLASSES.get(self)
+        if ty is None:
+            raise ValueError(f"{self} is not a valid {self.__class__}")
+        return ty
+
+
+@dataclass(slots=True)
 class Structure(
     angler.util.ASTNode,
     Serialize,
@@ -84,19 +73,19 @@ class Structure(
         Using the type of the structure, update the value of the underlying StructureDef
         to the appropriate type.
         """
-        cls = self.ty.as_class()
-        if issubclass(cls, Serialize) and isinstance(self.definition.value, dict):
-            # special case: distinguish Community_Set_Match_Expr subclass
-            if cls == comms.CommunitySetMatchExpr:
-                cls = _infer_community_set_match_expr_class(self.definition.value)
-            self.definition.value = cast(
-                vrf.Vrf
-                | acl.RouteFilterList
-                | RoutingPolicy
-                | acl.Acl
-                | comms.CommunitySetMatchExpr,
-                cls.from_dict(self.definition.value),
-            )
+        load = _STRUCTURE_LOADERS.get(self.ty)
+        if load is not None and isinstance(self.definition.value, dict):
+            self.definition.value = load(self.definition.value)
+
+
+_STRUCTURE_CLASSES: dict[StructureType, type] = {
+    StructureType.COMMS_MATCH: comms.CommunitySetMatchExpr,
+    StructureType.IP_ACCESS_LIST: acl.Acl,
+    StructureType.ROUTE_FILTER_LIST: acl.RouteFilterList,
+    StructureType.ROUTE6_FILTER_LIST: acl.Route6FilterList,
+    StructureType.ROUTING_POLICY: RoutingPolicy,
+    StructureType.VRF: vrf.Vrf,
+}
 
 
 def _infer_community_set_match_expr_class(value):
@@ -119,3 +108,18 @@ def _infer_community_set_match_expr_class(value):
         return comms.CommunitySetMatchAll
     else:
         raise KeyError(f"Unable to infer CommunitySetMatchExpr subclass for {value}")
+
+
+def _load_community_set_match_expr(value: dict) -> comms.CommunitySetMatchExpr:
+    """Load a Community_Set_Match_Expr structure, inferring its subclass."""
+    return _infer_community_set_match_expr_class(value).from_dict(value)
+
+
+# the function loading the definition of each type of structure,
+# special-casing Community_Set_Match_Expr to distinguish its subclass
+_STRUCTURE_LOADERS: dict[StructureType, Callable[[dict], Any]] = {
+    ty: cls.from_dict
+    for ty, cls in _STRUCTURE_CLASSES.items()
+    if issubclass(cls, Serialize)
+}
+_STRUCTURE_LOADERS[StructureType.COMMS_MATCH] = _load_community_set_match_expr
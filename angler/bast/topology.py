@@ -8,21 +8,21 @@ from angler.serialize import Serialize, Field
 from ipaddress import IPv4Address
 
 
-@dataclass
-class Node(Serialize, nodeid="id", nodename="name"):
+@dataclass(slots=True)
+class Node(Serialize, nodeid=Field("id", str), nodename=Field("name", str)):
     """A node in the network."""
 
     nodeid: str
     nodename: str
 
 
-@dataclass
-class Interface(Serialize, host="hostname", iface="interface"):
+@dataclass(slots=True)
+class Interface(Serialize, host=Field("hostname", str), iface=Field("interface", str)):
     host: str
     iface: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge(
     Serialize,
     iface=Field("Interface", Interface),
@@ -48,23 +48,16 @@ def edges_to_graph(edges: list[Edge]) -> igraph.Graph:
     Each vertex has an associated name (the hostname),
     and each edge has a list of IP addresses associated with its endpoints.
     """
-    hosts = dict()
-    edge_ips = []
-    i = 0
+    # map each host to its index, in the order the hosts are first seen
+    hosts: dict[str, int] = {}
     igraph_edges = []
     for edge in edges:
-        src = edge.iface.host
-        snk = edge.remote_iface.host
-        if src not in hosts:
-            hosts[src] = i
-            i += 1
-        if snk not in hosts:
-            hosts[snk] = i
-            i += 1
-        igraph_edges.append((hosts[src], hosts[snk]))
-        edge_ips.append((edge.ips, edge.remote_ips))
-    # sort the hosts by the index and then return the host names in order
-    host_names = [h for h, _ in sorted(hosts.items(), key=lambda x: x[1])]
+        src = hosts.setdefault(edge.iface.host, len(hosts))
+        snk = hosts.setdefault(edge.remote_iface.host, len(hosts))
+        igraph_edges.append((src, snk))
+    edge_ips = [(edge.ips, edge.remote_ips) for edge in edges]
+    # dicts preserve insertion order, so the host names are already in index order
+    host_names = list(hosts)
     return igraph.Graph(
         edges=igraph_edges,
         directed=True,
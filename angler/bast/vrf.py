@@ -9,18 +9,18 @@ from angler.serialize import Serialize, Field
 import angler.util
 
 
-@dataclass
+@dataclass(slots=True)
 class Ipv4UnicastAddressFamily(
     angler.util.ASTNode,
     Serialize,
-    export_policy="exportPolicy",
-    import_policy="importPolicy",
+    export_policy=Field("exportPolicy", str),
+    import_policy=Field("importPolicy", str),
 ):
     export_policy: Optional[str]
     import_policy: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class BgpActivePeerConfig(
     angler.util.ASTNode,
     Serialize,
@@ -46,7 +46,7 @@ class BgpActivePeerConfig(
     peer_ip: IPv4Address
 
 
-@dataclass
+@dataclass(slots=True)
 class BgpProcess(
     angler.util.ASTNode,
     Serialize,
@@ -57,7 +57,7 @@ class BgpProcess(
     router: IPv4Address
 
 
-@dataclass
+@dataclass(slots=True)
 class OspfProcess(
     angler.util.ASTNode,
     Serialize,
@@ -69,7 +69,7 @@ class OspfProcess(
     areas: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Vrf(
     angler.util.ASTNode,
     Serialize,
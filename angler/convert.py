@@ -8,9 +8,10 @@ Current TODOs:
 - No support for ACLs
 - No support for VRFs other than the default
 """
+from collections.abc import Sequence
 from dataclasses import dataclass
 from ipaddress import IPv4Address
-from typing import Optional, TypeVar, cast
+from typing import Optional, TypeVar
 
 from angler.bast.base import OwnedIP
 import angler.bast.json as json
@@ -105,6 +106,12 @@ def convert_expr(b: bex.Expression, simplify: bool = False) -> aex.Expression:
                     elif new_c == aex.LiteralBool(True):
                         continue
                     conj.append(new_c)
+                # an empty conjunction is true, and a singleton is just its conjunct
+                match conj:
+                    case []:
+                        return aex.LiteralBool(True)
+                    case [c]:
+                        return c
             else:
                 conj = [convert_expr(c) for c in conjuncts]
             return aex.Conjunction(conj)
@@ -122,6 +129,12 @@ def convert_expr(b: bex.Expression, simplify: bool = False) -> aex.Expression:
                     elif new_d == aex.LiteralBool(True):
                         return new_d
                     disj.append(new_d)
+                # an empty disjunction is false, and a singleton is just its disjunct
+                match disj:
+                    case []:
+                        return aex.LiteralBool(False)
+                    case [d]:
+                        return d
             else:
                 disj = [convert_expr(d) for d in disjuncts]
             return aex.Disjunction(disj)
@@ -315,6 +328,24 @@ def update_arg_result(
     return update_arg(update=result, ty=aty.EnvironmentType.RESULT)
 
 
+# the result fields set by each static statement which creates a fresh result
+_STATIC_RESULTS: dict[bsm.StaticStatementType, dict[str, bool]] = {
+    bsm.StaticStatementType.EXIT_ACCEPT: {"_value": True, "_exit": True},
+    bsm.StaticStatementType.EXIT_REJECT: {"_value": False, "_exit": True},
+    bsm.StaticStatementType.RETURN_TRUE: {"_value": True, "_return": True},
+    bsm.StaticStatementType.RETURN_FALSE: {"_value": False, "_return": True},
+    bsm.StaticStatementType.FALL_THROUGH: {"_fallthrough": True, "_return": True},
+    bsm.StaticStatementType.RETURN: {"_return": True},
+}
+# the default action set by each static statement which updates it
+_STATIC_DEFAULT_ACTIONS: dict[bsm.StaticStatementType, bool] = {
+    bsm.StaticStatementType.SET_ACCEPT: True,
+    bsm.StaticStatementType.SET_LOCAL_ACCEPT: True,
+    bsm.StaticStatementType.SET_REJECT: False,
+    bsm.StaticStatementType.SET_LOCAL_REJECT: False,
+}
+
+
 def convert_stmt(b: bsm.Statement, simplify: bool = False) -> list[asm.Statement]:
     """
     Convert a Batfish AST statement into an Angler AST statement.
@@ -397,46 +428,25 @@ def convert_stmt(b: bsm.Statement, simplify: bool = False) -> list[asm.Statement
             # NOTE(tim): these statements generate a fresh result type,
             # meaning all result fields are reset to their default values and then
             # assigned according to the type of statement
-            match ty:
-                case bsm.StaticStatementType.EXIT_ACCEPT:
-                    update = create_result(_value=True, _exit=True)
-                case bsm.StaticStatementType.EXIT_REJECT:
-                    update = create_result(_value=False, _exit=True)
-                case bsm.StaticStatementType.RETURN_TRUE:
-                    update = create_result(_value=True, _return=True)
-                case bsm.StaticStatementType.RETURN_FALSE:
-                    update = create_result(_value=False, _return=True)
-                case bsm.StaticStatementType.FALL_THROUGH:
-                    update = create_result(_fallthrough=True, _return=True)
-                case bsm.StaticStatementType.RETURN:
-                    update = create_result(_return=True)
-                case bsm.StaticStatementType.LOCAL_DEF:
-                    value_expr = get_arg(aty.EnvironmentType.LOCAL_DEFAULT_ACTION)
-                    update = create_result(_value=value_expr)
-                case bsm.StaticStatementType.SET_ACCEPT | bsm.StaticStatementType.SET_LOCAL_ACCEPT:
-                    # TODO: distinguish local default action and default action?
-                    # NOTE(tim): return directly since this statement updates the default action
-                    # instead of the result
-                    return [
-                        update_arg(
-                            aex.LiteralBool(True),
-                            aty.EnvironmentType.LOCAL_DEFAULT_ACTION,
-                        )
-                    ]
-                case bsm.StaticStatementType.SET_REJECT | bsm.StaticStatementType.SET_LOCAL_REJECT:
-                    # TODO: distinguish local default action and default action?
-                    # NOTE(tim): return directly since this statement updates the default action
-                    # instead of the result
-                    return [
-                        update_arg(
-                            aex.LiteralBool(False),
-                            aty.EnvironmentType.LOCAL_DEFAULT_ACTION,
-                        )
-                    ]
-                case _:
-                    raise NotImplementedError(
-                        f"No convert case for static statement {ty} found."
+            if ty in _STATIC_RESULTS:
+                update = create_result(**_STATIC_RESULTS[ty])
+            elif ty == bsm.StaticStatementType.LOCAL_DEF:
+                value_expr = get_arg(aty.EnvironmentType.LOCAL_DEFAULT_ACTION)
+                update = create_result(_value=value_expr)
+            elif ty in _STATIC_DEFAULT_ACTIONS:
+                # TODO: distinguish local default action and default action?
+                # NOTE(tim): return directly since this statement updates the default action
+                # instead of the result
+                return [
+                    update_arg(
+                        aex.LiteralBool(_STATIC_DEFAULT_ACTIONS[ty]),
+                        aty.EnvironmentType.LOCAL_DEFAULT_ACTION,
                     )
+                ]
+            else:
+                raise NotImplementedError(
+                    f"No convert case for static statement {ty} found."
+                )
             return [update_arg(update, aty.EnvironmentType.RESULT)]
         case bsm.PrependAsPath():
             # NOTE: ignored
@@ -448,18 +458,13 @@ def convert_stmt(b: bsm.Statement, simplify: bool = False) -> list[asm.Statement
 
 
 def convert_stmts(
-    stmts: list[bsm.Statement], simplify: bool = False
+    stmts: Sequence[bsm.Statement], simplify: bool = False
 ) -> list[asm.Statement]:
     """Convert a list of Batfish statements into an Angler statement."""
-    match stmts:
-        case []:
-            return []
-        case [hd, *tl]:
-            return convert_stmt(hd, simplify=simplify) + convert_stmts(
-                tl, simplify=simplify
-            )
-        case _:
-            raise Exception("unreachable")
+    new_stmts = []
+    for stmt in stmts:
+        new_stmts.extend(convert_stmt(stmt, simplify=simplify))
+    return new_stmts
 
 
 def unreachable() -> aex.Expression[bool]:
@@ -482,7 +487,7 @@ def unreachable() -> aex.Expression[bool]:
 
 
 def convert_routing_policy(
-    body: list[bsm.Statement], simplify: bool = False
+    body: Sequence[bsm.Statement], simplify: bool = False
 ) -> net.Func:
     """
     Convert a Batfish routing policy into an Angler function.
@@ -504,30 +509,25 @@ def convert_routing_policy(
         # list of statements [s1, s2, s3, ...] into:
         # [s1, (if unreachable then [] else [s2, (if unreachable then [] else [s3, ...])])]
         # where "unreachable" is an expression that checks if exited or returned is true.
-        match stmts:
-            case []:
-                return []
-            case [hd]:
-                # NOTE(tim):
-                # this is an additional case to reduce nesting; without it, we can end up producing
-                # empty "if unreachable then [] else []" statements
-                if isinstance(hd, asm.IfStatement):
-                    hd.true_stmt = recurse(hd.true_stmt)
-                    hd.false_stmt = recurse(hd.false_stmt)
-                return cast(list[asm.Statement], [hd])
-            case [hd, *tl]:
-                if isinstance(hd, asm.IfStatement):
-                    hd.true_stmt = recurse(hd.true_stmt)
-                    hd.false_stmt = recurse(hd.false_stmt)
-                return cast(
-                    list[asm.Statement],
-                    [
-                        hd,
-                        asm.IfStatement("early_return", unreachable(), [], recurse(tl)),
-                    ],
-                )
-            case _:
-                raise Exception("unreachable")
+        for stmt in stmts:
+            if isinstance(stmt, asm.IfStatement):
+                stmt.true_stmt = recurse(stmt.true_stmt)
+                stmt.false_stmt = recurse(stmt.false_stmt)
+        if not stmts:
+            return []
+        # build the nesting from the last statement outwards, rather than recursing on
+        # (and copying) the tail of the list for each statement
+        # NOTE(tim):
+        # the last statement is not followed by an "early return" case, to reduce
+        # nesting; otherwise, we can end up producing empty
+        # "if unreachable then [] else []" statements
+        new_stmts: list[asm.Statement] = [stmts[-1]]
+        for hd in reversed(stmts[:-1]):
+            new_stmts = [
+                hd,
+                asm.IfStatement("early_return", unreachable(), [], new_stmts),
+            ]
+        return new_stmts
 
     # convert the body and then add the early-return tests
     new_body = recurse(convert_stmts(body, simplify=simplify))
@@ -715,7 +715,7 @@ def convert_batfish(bf: json.BatfishJson, simplify=False) -> net.Network:
     print("Conversion complete!")
     # construct external peers so that they can be encoded to JSON
     external_peers = [
-        net.ExternalPeer(ip, asn, list(peers))
+        net.ExternalPeer(ip, asn, tuple(peers))
         for ((ip, asn), peers) in externals.items()
     ]
     return net.Network(
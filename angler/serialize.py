@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+import sys
 from collections.abc import Callable
+from enum import Enum
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Network
 from typing import (
     Any,
     Optional,
@@ -17,15 +21,224 @@ class Field:
     json_name: str
     # the type of this field
     ty: type
-    # the default to use for this field
+    # the default to use for this field when it is absent;
+    # this value is shared between instances, so it should be immutable (e.g. () rather than [])
     default: Any
 
     def __init__(self, name: str, ty: type = Any, default: Any = None):
-        self.json_name = name
+        # intern the name so that dictionary lookups on it can compare by identity
+        self.json_name = sys.intern(name)
         self.ty = ty
         self.default = default
 
 
+# A converter turns a (non-None) JSON value into the value stored in a field.
+Converter = Callable[[Any], Any]
+# A plan entry: the field's attribute name, its JSON name, its default and its converter,
+# along with the converter for its elements if the field is a list (otherwise None).
+PlanEntry = tuple[str, str, Any, Converter, Optional[Converter]]
+# A loader constructs an instance of the given class from a dictionary.
+Loader = Callable[[type, dict], Any]
+
+
+def _identity(v: Any) -> Any:
+    return v
+
+
+def _convert_str(v: Any) -> Any:
+    """
+    Convert v to a string, interning it:
+    names (of policies, hosts, communities, etc.) are repeated throughout Batfish's output,
+    so interning lets them share one object and compare by identity.
+    """
+    if type(v) is str:
+        return sys.intern(v)
+    return str(v) if v and not isinstance(v, str) else v
+
+
+def _cached_constructor(ty: type) -> Callable[[Any], Any]:
+    """
+    Return a constructor for ty which caches the values constructed from strings.
+    Only use this for immutable types, as equal inputs share the same constructed value.
+    """
+    cached = lru_cache(maxsize=4096)(ty)
+
+    def construct(v: Any) -> Any:
+        return cached(v) if type(v) is str else ty(v)
+
+    return construct
+
+
+# addresses and prefixes recur frequently in Batfish's output (e.g. peer and gateway IPs),
+# so cache their parsed values
+_CACHED_CONSTRUCTORS: dict[type, Callable[[Any], Any]] = {
+    ty: _cached_constructor(ty)
+    for ty in (IPv4Address, IPv4Interface, IPv4Network, IPv6Network)
+}
+
+
+@lru_cache(maxsize=None)
+def _elem_converter(ty: Any, recurse: bool) -> Converter:
+    """
+    Return a converter for a single (non-container) value of type ty.
+    Falsy values are always returned unchanged.
+    Converters are shared between all fields with the same element type.
+    """
+    if ty is Any:
+        return _identity
+    if ty is str:
+        return _convert_str
+    if recurse and isinstance(ty, type) and issubclass(ty, Serialize):
+        from_dict = ty.from_dict
+
+        def convert_serialize(v: Any) -> Any:
+            return from_dict(v) if v and isinstance(v, dict) else v
+
+        return convert_serialize
+    if isinstance(ty, type) and issubclass(ty, Enum):
+        # look members up by value directly, skipping EnumMeta.__call__
+        # (and falling back to it for anything else, to report errors)
+        members = ty._value2member_map_
+
+        def convert_enum(v: Any) -> Any:
+            if type(v) is str and v in members:
+                return members[v]
+            return ty(v) if v and not isinstance(v, ty) else v
+
+        return convert_enum
+    if isinstance(ty, type):
+        construct = _CACHED_CONSTRUCTORS.get(ty, ty)
+
+        def convert_callable(v: Any) -> Any:
+            return construct(v) if v and not isinstance(v, ty) else v
+
+        return convert_callable
+
+    # fall back to resolving the type on every call
+    def convert_other(v: Any) -> Any:
+        return Serialize._from_dict_aux(v, ty, recurse)
+
+    return convert_other
+
+
+def _field_converter(field: str, fieldty: Any, recurse: bool) -> Converter:
+    """
+    Return a converter for the given field's type,
+    resolving any container type arguments ahead of time.
+    """
+    type_args = get_args(fieldty)
+    origin = get_origin(fieldty)
+
+    def type_error(v: Any) -> TypeError:
+        return TypeError(
+            f"given value '{v}' for field '{field}' does not match type '{fieldty}'"
+        )
+
+    if (origin is tuple or isinstance(fieldty, tuple)) and type_args[1:] == (...,):
+        # for variable-length tuples, convert each element with the first type argument
+        elem_conv = _elem_converter(type_args[0], recurse)
+
+        def convert_var_tuple(v: Any) -> tuple:
+            # JSON has no tuples, so accept lists as well
+            if not isinstance(v, (tuple, list)):
+                raise type_error(v)
+            return tuple([elem_conv(e) for e in v])
+
+        return convert_var_tuple
+    elif origin is tuple or isinstance(fieldty, tuple):
+        elem_convs = [_elem_converter(ty_arg, recurse) for ty_arg in type_args]
+
+        def convert_tuple(v: Any) -> tuple:
+            if not isinstance(v, (tuple, list)):
+                raise type_error(v)
+            # for tuples, zip the arguments (or leave them as is if none are given)
+            if not elem_convs:
+                return tuple(v)
+            return tuple([conv(e) for (e, conv) in zip(v, elem_convs)])
+
+        return convert_tuple
+    elif origin is list or isinstance(fieldty, list):
+        # for lists, unwrap the first type argument (if given), otherwise use Any
+        elem_conv = _elem_converter(type_args[0] if type_args else Any, recurse)
+
+        def convert_list(v: Any) -> list:
+            if not isinstance(v, list):
+                raise type_error(v)
+            return [elem_conv(e) for e in v]
+
+        return convert_list
+    elif origin is dict or isinstance(fieldty, dict):
+        key_conv = _elem_converter(type_args[0] if type_args else Any, recurse)
+        val_conv = _elem_converter(type_args[1] if type_args else Any, recurse)
+
+        def convert_dict(v: Any) -> dict:
+            if not isinstance(v, dict):
+                raise type_error(v)
+            # convert the keys and values of the given dictionary
+            return {key_conv(k): val_conv(val) for (k, val) in v.items()}
+
+        return convert_dict
+    else:
+        return _elem_converter(fieldty, recurse)
+
+
+def _plan(fields: dict[str, Field], recurse: bool) -> tuple[PlanEntry, ...]:
+    """Return the plan used by `Serialize.from_dict` to decode the given fields."""
+    return tuple(
+        (
+            k,
+            f.json_name,
+            f.default,
+            _field_converter(k, f.ty, recurse),
+            _list_elem_converter(f.ty, recurse),
+        )
+        for k, f in fields.items()
+    )
+
+
+def _list_elem_converter(fieldty: Any, recurse: bool) -> Optional[Converter]:
+    """Return the converter for the elements of fieldty if it is a list type, or None."""
+    if get_origin(fieldty) is list or fieldty is list:
+        type_args = get_args(fieldty)
+        return _elem_converter(type_args[0] if type_args else Any, recurse)
+    return None
+
+
+def _compile_loader(name: str, plan: tuple[PlanEntry, ...]) -> Loader:
+    """
+    Generate a function which constructs a class from a dictionary using the given plan.
+    The generated function is specialized to the plan's fields, so it performs no
+    iteration over the fields or tuple unpacking when called.
+    The class is passed in as an argument (rather than captured), so that the
+    function can be shared by any class with the same plan.
+    """
+    namespace: dict[str, Any] = {}
+    lines = [f"def load_{name}(cls, d):"]
+    args = []
+    for i, (field, fieldname, default, convert, convert_elem) in enumerate(plan):
+        namespace[f"convert_{i}"] = convert
+        namespace[f"default_{i}"] = default
+        value = f"convert_{i}(v)"
+        if convert_elem is not None:
+            # inline the loop over list elements,
+            # leaving anything other than a list to the field's converter (to report errors)
+            namespace[f"convert_elem_{i}"] = convert_elem
+            value = (
+                f"([convert_elem_{i}(e) for e in v] if type(v) is list else {value})"
+            )
+        lines += [
+            f"    if {fieldname!r} in d:",
+            f"        v = d[{fieldname!r}]",
+            f"        f_{i} = None if v is None else {value}",
+            "    else:",
+            f"        f_{i} = default_{i}",
+        ]
+        args.append(f"{field}=f_{i}")
+    lines.append(f"    return cls({', '.join(args)})")
+    exec("\n".join(lines), namespace)
+    return namespace[f"load_{name}"]
+
+
 class Serialize:
     """
     A mixin class that implements two dictionary
@@ -73,16 +286,18 @@ class Serialize:
     True
     """
 
-    delegate: Optional[tuple[str, Callable[[str], Type]]]
-    fields: dict[str, Field] = {}
-    with_type: Optional[str]
+    # no per-instance state, so that subclasses may use slots
+    __slots__ = ()
 
-    def __init__(self, delegate=None, with_type=None, **fields: str | Field):
-        self.delegate = delegate
-        self.with_type = with_type
-        self.fields = {
-            k: (Field(f) if isinstance(f, str) else f) for k, f in fields.items()
-        } or {}
+    delegate: Optional[tuple[str, Callable[[str], Type]]] = None
+    fields: dict[str, Field] = {}
+    with_type: Optional[str] = None
+    # the fields with their converters, resolved once when the class is created
+    _field_plan: tuple[PlanEntry, ...] = ()
+    # the same, but without recursively decoding Serialize fields
+    _shallow_field_plan: tuple[PlanEntry, ...] = ()
+    # loaders generated from the plans, keyed by recurse and the skipped delegate field
+    _loaders: dict[tuple[bool, Optional[str]], Loader] = {}
 
     def __init_subclass__(
         cls,
@@ -102,11 +317,21 @@ class Serialize:
         fields and the values are a string specifying the desired field name,
         or a tuple containing a field name string and a type.
         """
+        if not (delegate or with_type or fields) and "fields" in cls.__dict__:
+            # the class is being re-created from a namespace that has already been set up:
+            # @dataclass(slots=True) builds a new class from a copy of the old class's
+            # __dict__, which holds the fields, plans and loaders assigned below,
+            # but calls __init_subclass__ again without our keyword arguments;
+            # keep what was copied rather than resetting it to no fields
+            return
         cls.delegate = delegate
         cls.with_type = with_type
         cls.fields = {
             k: (Field(f) if isinstance(f, str) else f) for k, f in fields.items()
         } or {}
+        cls._field_plan = _plan(cls.fields, recurse=True)
+        cls._shallow_field_plan = _plan(cls.fields, recurse=False)
+        cls._loaders = {}
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -130,14 +355,11 @@ class Serialize:
                     k: (vv.to_dict() if issubclass(type(vv), Serialize) else vv)
                     for k, vv in v.items()
                 }
-            elif isinstance(v, list):
+            elif isinstance(v, (list, tuple)):
+                # JSON has no tuples, so encode them as lists
                 d[fieldname] = [
                     e.to_dict() if issubclass(type(e), Serialize) else e for e in v
                 ]
-            elif isinstance(v, tuple):
-                d[fieldname] = (
-                    e.to_dict() if issubclass(type(e), Serialize) else e for e in v
-                )
             else:
                 d[fieldname] = v.to_dict() if issubclass(type(v), Serialize) else v
         return d
@@ -183,62 +405,13 @@ class Serialize:
                     f"expected a delegate field '{del_field_name}' for {cls.__name__} in '{d}'",
                 )
                 raise e
-        kwargs = {}
-        for field in cls.fields:
-            fieldty = cls.fields[field].ty
-            fieldname = cls.fields[field].json_name
-            if fieldname == del_field_name:
-                # skip the field if it's the delegate field
-                continue
-            v = d.get(fieldname, cls.fields[field].default)
-            # exit early if v is None
-            if v is None:
-                kwargs[field] = v
-                continue
-            type_args = get_args(fieldty)
-            if get_origin(fieldty) is tuple or isinstance(fieldty, tuple):
-                if not isinstance(v, tuple):
-                    raise TypeError(
-                        f"given value '{v}' for field '{field}' does not match type '{fieldty}'"
-                    )
-                # for tuples, zip the arguments
-                if not type_args:
-                    type_args = [Any] * len(v)
-                typed_vals = zip(v, type_args)
-                # now process them in sequence
-                kwargs[field] = tuple(
-                    [
-                        Serialize._from_dict_aux(e, ty_arg, recurse)
-                        for (e, ty_arg) in typed_vals
-                    ]
-                )
-            elif get_origin(fieldty) is list or isinstance(fieldty, list):
-                if not isinstance(v, list):
-                    raise TypeError(
-                        f"given value '{v}' for field '{field}' does not match type '{fieldty}'"
-                    )
-                # for lists, unwrap the first type argument (if given), otherwise use Any
-                kwargs[field] = [
-                    Serialize._from_dict_aux(
-                        e, type_args[0] if type_args else Any, recurse
-                    )
-                    for e in v
-                ]
-            elif get_origin(fieldty) is dict or isinstance(fieldty, dict):
-                if not isinstance(v, dict):
-                    raise TypeError(
-                        f"given value '{v}' for field '{field}' does not match type '{fieldty}'"
-                    )
-                # convert the keys and values of the given dictionary
-                kwargs[field] = {
-                    Serialize._from_dict_aux(
-                        k, type_args[0] if type_args else Any, recurse
-                    ): Serialize._from_dict_aux(
-                        val, type_args[1] if type_args else Any, recurse
-                    )
-                    for (k, val) in v.items()
-                }
-            else:
-                kwargs[field] = Serialize._from_dict_aux(v, fieldty, recurse)
-        instance = cls(**kwargs)
-        return instance
+        load = cls._loaders.get((recurse, del_field_name))
+        if load is None:
+            plan = cls._field_plan if recurse else cls._shallow_field_plan
+            # skip the field if it's the delegate field
+            load = _compile_loader(
+                cls.__name__,
+                tuple(entry for entry in plan if entry[1] != del_field_name),
+            )
+            cls._loaders[(recurse, del_field_name)] = load
+        return load(cls, d)
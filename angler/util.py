@@ -3,7 +3,9 @@
 Utilities for manipulating ASTs.
 """
 from enum import Enum
-from typing import Callable
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from types import UnionType
+from typing import Any, Callable, Literal, Union, get_args, get_origin
 from dataclasses import dataclass, fields, is_dataclass
 from collections.abc import Iterable
 from angler.serialize import Serialize
@@ -19,15 +21,13 @@ def parse_qualified_class(name: str) -> str:
     Has the following behavior mimicking Angler:
     - Class name with inner types: "name(inner_name;...)" -> "name"
     """
-    try:
-        _, name = name.rsplit(sep=".", maxsplit=1)
-        # if a $ is found, name will contain the string following it
-        # if $ is not found, name will contain the original string
-        name = name[name.rfind("$") + 1 :]
-    finally:
-        # drop anything that follows an open parenthesis
-        front_index = name.find("(")
-        return name if front_index == -1 else name[:front_index]
+    # drop anything that follows an open parenthesis
+    end = name.find("(")
+    if end == -1:
+        end = len(name)
+    # start after the last . or $ before the parenthesis (or at 0 if neither is found)
+    start = max(name.rfind(".", 0, end), name.rfind("$", 0, end)) + 1
+    return name[start:end]
 
 
 class Variant(Enum):
@@ -52,26 +52,127 @@ class Variant(Enum):
         Qualified names (names which include Java-like dot-notation to indicate namespaces)
         are parsed according to `parse_qualified_class`.
         """
-        return cls(parse_qualified_class(s)).as_class()
+        classes = _VARIANT_CLASSES.get(cls)
+        if classes is None:
+            classes = _VARIANT_CLASSES[cls] = _variant_classes(cls)
+        if s in classes:
+            return classes[s]
+        name = parse_qualified_class(s)
+        if name in classes:
+            # remember the qualified name too, so that we don't parse it again
+            classes[s] = classes[name]
+            return classes[s]
+        # fall back to the enum to raise the appropriate error
+        return cls(name).as_class()
+
+
+# tables mapping the values of each Variant (and the qualified names parsed into them)
+# to their associated types, built on first use
+# (after the modules defining the associated types have been loaded)
+_VARIANT_CLASSES: dict[type[Variant], dict[str, type]] = {}
+
+
+def _variant_classes(cls: type[Variant]) -> dict[str, type]:
+    """
+    Return a dictionary from the values of the given Variant to their associated types.
+    Elements with no associated type are omitted.
+    """
+    classes = {}
+    for variant in cls:
+        try:
+            classes[variant.value] = variant.as_class()
+        except (NotImplementedError, ValueError):
+            pass
+    return classes
 
 
 @dataclass
 class ASTNode(Serialize):
     """The base class for AST nodes."""
 
+    __slots__ = ()
+
     def visit(self, f: Callable) -> None:
-        # recursively descend through the fields of the ASTNodes
-        if is_dataclass(self):
-            f(self)
-            for field in fields(self):
-                field_node = getattr(self, field.name)
-                if isinstance(field_node, dict):
-                    for field_elem in [
-                        e for e in field_node.values() if isinstance(e, ASTNode)
-                    ]:
-                        field_elem.visit(f)
-                elif isinstance(field_node, Iterable):
-                    for field_elem in [e for e in field_node if isinstance(e, ASTNode)]:
-                        field_elem.visit(f)
+        # descend through the fields of the ASTNodes using an explicit stack
+        # (rather than recursing), so deep ASTs cannot exceed the recursion limit;
+        # children are pushed in reverse so that nodes are visited in pre-order
+        stack: list[ASTNode] = [self]
+        while stack:
+            node = stack.pop()
+            cls = type(node)
+            plan = _VISIT_PLANS.get(cls)
+            if plan is None:
+                plan = _VISIT_PLANS[cls] = _visit_plan(cls)
+            if not is_dataclass(node):
+                continue
+            f(node)
+            children = []
+            for field in plan:
+                field_node = getattr(node, field)
+                # check the concrete container types produced by from_dict first,
+                # falling back to the (slower) abstract checks for anything else
+                field_ty = type(field_node)
+                if field_ty is list or field_ty is tuple:
+                    field_elems = field_node
+                elif field_ty is dict or isinstance(field_node, dict):
+                    field_elems = field_node.values()
                 elif isinstance(field_node, ASTNode):
-                    field_node.visit(f)
+                    children.append(field_node)
+                    continue
+                elif isinstance(field_node, Iterable):
+                    field_elems = field_node
+                else:
+                    continue
+                for field_elem in field_elems:
+                    if isinstance(field_elem, ASTNode):
+                        children.append(field_elem)
+            children.reverse()
+            stack.extend(children)
+
+
+# types of field which can never contain an ASTNode
+_SCALAR_TYPES = (
+    str,
+    int,
+    float,
+    Enum,
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    type(None),
+)
+# the fields of each ASTNode class which visit descends into, built on first use
+_VISIT_PLANS: dict[type, tuple[str, ...]] = {}
+
+
+def _may_contain_node(ty: Any) -> bool:
+    """
+    Return True if a field of the given type may contain an ASTNode.
+    Types we cannot resolve (e.g. Any or forward references) are assumed to.
+    """
+    origin = get_origin(ty)
+    args = get_args(ty)
+    if origin in (Union, UnionType):
+        return any(_may_contain_node(arg) for arg in args)
+    if origin is Literal:
+        # the arguments are values, not types
+        return False
+    if origin is not None:
+        # visit only descends into the values of a dict
+        if origin is dict:
+            args = args[1:]
+        # skip the ... of variable-length tuples, which is not a type
+        args = tuple(arg for arg in args if arg is not Ellipsis)
+        return not args or any(_may_contain_node(arg) for arg in args)
+    return not (isinstance(ty, type) and issubclass(ty, _SCALAR_TYPES))
+
+
+def _visit_plan(cls: type) -> tuple[str, ...]:
+    """
+    Return the names of the fields of cls that may contain ASTNodes.
+    Leaf classes (with only scalar fields) have an empty plan.
+    """
+    if not is_dataclass(cls):
+        return ()
+    return tuple(field.name for field in fields(cls) if _may_contain_node(field.type))
@@ -6,6 +6,7 @@ from angler.aast import statement as asm
 from angler.aast import expression as aex
 from angler.aast import types as aty
 from angler.convert import (
+    convert_expr,
     convert_routing_policy,
     convert_stmt,
     get_arg,
@@ -44,6 +45,26 @@ def test_convert_exit_reject_statement():
     ]
 
 
+def test_convert_simplify_trivial_junctions():
+    call = bbe.CallExpr("p")
+    true = bbe.StaticBooleanExpr(bbe.StaticBooleanExprType.TRUE)
+    false = bbe.StaticBooleanExpr(bbe.StaticBooleanExprType.FALSE)
+    assert convert_expr(bbe.Conjunction([call]), simplify=True) == aex.CallExpr("p")
+    assert convert_expr(bbe.Conjunction([true]), simplify=True) == aex.LiteralBool(True)
+    disj = bbe.Disjunction([false, call])
+    assert convert_expr(disj, simplify=True) == aex.CallExpr("p")
+    assert convert_expr(bbe.Disjunction([]), simplify=True) == aex.LiteralBool(False)
+    # without simplification, the structure is kept
+    assert convert_expr(bbe.Conjunction([call])) == aex.Conjunction([aex.CallExpr("p")])
+
+
+def test_convert_match_protocol():
+    d = {"protocols": ["static", "bgp"]}
+    m = bbe.MatchProtocol.from_dict(d)
+    assert m.to_dict() == d
+    assert convert_expr(m) == aex.LiteralBool(True)
+
+
 def test_convert_routing_policy_empty():
     old = []
     new = convert_routing_policy(old)
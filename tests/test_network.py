@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+from angler.aast.network import ExternalPeer
+
+
+def test_external_peer_peering_immutable():
+    absent = ExternalPeer.from_dict({"Ip": "192.0.2.1"})
+    given = ExternalPeer.from_dict({"Ip": "192.0.2.2", "Peering": ["r1", "r2"]})
+    assert absent.peering == ()
+    assert given.peering == ("r1", "r2")
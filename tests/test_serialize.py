@@ -9,6 +9,36 @@ class Point3D(Serialize, coords=Field("coords", tuple[int, int, int])):
     coords: tuple[int, int, int]
 
 
+@dataclass
+class Path(Serialize, hops=Field("hops", tuple[Point3D, ...], ())):
+    hops: tuple[Point3D, ...]
+
+
+@dataclass(slots=True)
+class Slotted(Serialize, x=Field("x", int), label=Field("label", str)):
+    x: int
+    label: str
+
+
+@dataclass(slots=True)
+class SlottedChild(
+    Slotted,
+    Serialize,
+    x=Field("x", int),
+    label=Field("label", str),
+    n=Field("n", int, 0),
+):
+    n: int = 0
+
+
+class Plain(Serialize, x=Field("x")):
+    __slots__ = ("x",)
+
+    def __init__(self, x):
+        super().__init__()
+        self.x = x
+
+
 @dataclass
 class A(Serialize):
     ...
@@ -58,6 +88,41 @@ def test_from_dict_tuple():
     assert p.coords == coords
 
 
+def test_from_dict_var_tuple():
+    d = {"hops": [{"coords": [0, 0, 1]}, {"coords": [1, 0, 1]}]}
+    p = Path.from_dict(d)
+    assert p.hops == (Point3D((0, 0, 1)), Point3D((1, 0, 1)))
+    assert p.to_dict() == d
+
+
+def test_from_dict_slots_dataclass():
+    d = {"x": 1, "label": "one"}
+    s = Slotted.from_dict(d)
+    assert s == Slotted(1, "one")
+    assert not hasattr(s, "__dict__")
+    assert s.to_dict() == d
+
+
+def test_serialize_instance():
+    assert Serialize().to_dict() == {}
+
+
+def test_slots_dataclass_keeps_fields():
+    # @dataclass(slots=True) re-creates the class; its fields must survive
+    assert "__dict__" not in Slotted.__dict__
+    assert list(Slotted.fields) == ["x", "label"]
+    assert list(SlottedChild.fields) == ["x", "label", "n"]
+    c = SlottedChild.from_dict({"x": 1, "label": "one", "n": 2})
+    assert c == SlottedChild(1, "one", 2)
+    assert not hasattr(c, "__dict__")
+
+
+def test_from_dict_slots_super_init():
+    p = Plain.from_dict({"x": 3})
+    assert p.x == 3
+    assert not hasattr(p, "__dict__")
+
+
 def test_from_dict_subclass_dataclass():
     d = {"c": 2}
     b = B.from_dict(d)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import sys
+from angler.util import parse_qualified_class, _visit_plan
+import angler.bast.boolexprs as bools
+import angler.bast.base as base
+
+
+def test_parse_qualified_class_unqualified():
+    assert parse_qualified_class("Conjunction") == "Conjunction"
+
+
+def test_parse_qualified_class_namespaced():
+    name = "org.batfish.datamodel.routing_policy.expr.Conjunction"
+    assert parse_qualified_class(name) == "Conjunction"
+
+
+def test_parse_qualified_class_named_subclass():
+    name = "org.batfish.datamodel.routing_policy.statement.Statements$StaticStatement"
+    assert parse_qualified_class(name) == "StaticStatement"
+
+
+def test_parse_qualified_class_inner_types():
+    assert parse_qualified_class("CommunityIs(a.b.Community;c$d)") == "CommunityIs"
+
+
+def test_parse_qualified_class_ignores_separators_in_inner_types():
+    # separators inside the parentheses no longer count:
+    # the original rsplit-based parser returned "d)" here
+    assert parse_qualified_class("CommunityIs(a.b.Community;c$d)") == "CommunityIs"
+    assert parse_qualified_class("a.b.CommunityIs(c.Community)") == "CommunityIs"
+
+
+def test_parse_qualified_class_unqualified_named_subclass():
+    # a $ is honoured without a preceding namespace:
+    # the original parser returned "Statements$StaticStatement" unchanged here
+    assert parse_qualified_class("Statements$StaticStatement") == "StaticStatement"
+
+
+def test_parse_qualified_class_trailing_separator():
+    assert parse_qualified_class("a.b.") == ""
+    assert parse_qualified_class("") == ""
+
+
+def test_visit_preorder():
+    t = bools.StaticBooleanExpr(bools.StaticBooleanExprType.TRUE)
+    f = bools.StaticBooleanExpr(bools.StaticBooleanExprType.FALSE)
+    e = bools.Conjunction([bools.Not(t), f])
+    visited = []
+    e.visit(visited.append)
+    assert visited == [e, e.conjuncts[0], t, f]
+
+
+def test_visit_deep():
+    e = bools.StaticBooleanExpr(bools.StaticBooleanExprType.TRUE)
+    depth = sys.getrecursionlimit() + 1
+    for _ in range(depth):
+        e = bools.Not(e)
+    visited = []
+    e.visit(visited.append)
+    assert len(visited) == depth + 1
+
+
+def test_visit_plan_skips_string_tuples():
+    plan = _visit_plan(base.BgpPeerConfig)
+    assert "node" in plan
+    assert "import_policy" not in plan and "export_policy" not in plan